@@ -13,6 +13,10 @@ def create_app():
     from app.base import base_bp
     app.register_blueprint(base_bp)
 
+    # configure all mappers once at startup instead of on the first query
+    from sqlalchemy.orm import configure_mappers
+    configure_mappers()
+
     app.jinja_env.globals["_"] = _
 
     @app.errorhandler(404)
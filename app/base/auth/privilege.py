@@ -1,8 +1,9 @@
 # app/base/auth/privilege.py
 from typing import Iterable, Any
-from functools import wraps
+from functools import cached_property, wraps
 from flask import abort, session
 from sqlalchemy import select
+from sqlalchemy.orm import raiseload
 
 class Privilege:
     _admin_role = '_admin'
@@ -15,18 +16,28 @@ class Privilege:
     def __init__(self, role_names: Iterable[str] | str = '_anonymous'):
         from app.extensions import db_session
         from app.database.user import UserRole
-        self.table_privilege: dict[str, str] = dict()
         self.role_family: set[str] = set()
+        self._family_roles: set[UserRole] = set()
         with db_session() as sess:
             if isinstance(role_names, str):
                 role_names = [role_names]
             user_roles = sess.scalars(
                 select(UserRole)
                 .where(UserRole.user_role_name.in_(role_names))
+                .options(raiseload('*')) # role_family queries on its own, skip the eager loads
             ).all()
-            self.role_family = set()
             for user_role in user_roles:
-                self.role_family |= {ur.user_role_name for ur in user_role.role_family}
+                self._family_roles |= user_role.role_family
+            self.role_family = {ur.user_role_name for ur in self._family_roles}
+
+    @cached_property
+    def table_privilege(self) -> dict[str, str]:
+        """
+        :return: { table name: permission letters } merged over the role family,
+        built on first use so that privilege checks by role names do not pay for it.
+        """
+        from app.database.user.dbmodels import mask_to_privilege
+        return mask_to_privilege(sum(self._family_roles, {}))
 
     @classmethod
     def session_match(cls, role_names: str | Iterable[str]) -> bool:
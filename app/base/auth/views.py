@@ -1,6 +1,7 @@
 # app/base/auth/views.py
 from flask import redirect, render_template, request, session, url_for
 from sqlalchemy import select
+from sqlalchemy.orm import raiseload
 from app.extensions import db_session
 
 def app_login():
@@ -18,7 +19,11 @@ def app_login():
     
     with db_session() as sess:
         from app.database.user import User
-        user = sess.scalar(select(User).where(User.user_name==user_name))
+        user = sess.scalar(
+            select(User)
+            .where(User.user_name==user_name)
+            .options(raiseload('*')) # role_family queries on its own, skip the eager loads
+        )
         if user and user.check_password(user_pw):
             session['ROLE_FAMILY'] = [ur.user_role_name for ur in user.role_family]
             session['USER_NAME'] = user.user_name
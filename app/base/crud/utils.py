@@ -15,12 +15,15 @@ __all__ = [
     'fetch_related_funcs'
 ]
 
+from functools import lru_cache
 from inspect import signature
-from typing import Any, Iterable
+from time import monotonic
+from types import FunctionType, MappingProxyType
+from typing import Any, Callable, Iterable, Mapping
 from enum import Enum
 from flask import abort, url_for, session as app_session
-from sqlalchemy import select, inspect
-from sqlalchemy.orm import Session
+from sqlalchemy import event, select, inspect
+from sqlalchemy.orm import Session, lazyload
 from app.base.auth.privilege import Privilege
 from app.utils import _
 from app.extensions import Base
@@ -28,7 +31,50 @@ from app.database.base import DataJson
 
 _default_viewer = 'base.crud.view_record'
 _default_link_target = None
+_empty_info: Mapping[str, Any] = MappingProxyType({}) # read-only default for relationship info
+_select_stmts: dict[tuple[Any, ...], Any] = dict()
+_table_stmts: dict[type[Base], Any] = dict()
+_select_lists: dict[tuple[Any, ...], tuple[list[tuple[str, str]], float]] = dict()
+"""
+option lists of the cached select statements and the time they were stored, by list key and language, 
+cleared whenever data is written.
 
+.. attention:: the cache is per process, writes made by other processes are only seen 
+after `_select_lists_ttl` seconds or the next local write.
+"""
+_select_lists_ttl = 60.0
+
+@event.listens_for(Session, 'after_flush')
+def _flush_select_lists(session: Session, flush_context: Any) -> None:
+    _select_lists.clear()
+    session.info['select_lists_stale'] = True
+@event.listens_for(Session, 'do_orm_execute')
+def _execute_select_lists(orm_execute_state: Any) -> None:
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        _select_lists.clear()
+        orm_execute_state.session.info['select_lists_stale'] = True
+@event.listens_for(Session, 'after_commit')
+@event.listens_for(Session, 'after_soft_rollback')
+def _end_select_lists(session: Session, *args: Any) -> None:
+    # lists cached by other sessions between the write and its commit or rollback may be outdated
+    if session.info.pop('select_lists_stale', False):
+        _select_lists.clear()
+
+@lru_cache(maxsize=None)
+def _get_row_splitter(Model: type[Base]) -> Callable[[Any], tuple[str, Any]]:
+    """
+    :return: a function splitting a row of primary key values followed by an instance
+        into the comma joined primary keys and the instance.
+    """
+    if len(Model.__mapper__.primary_key) == 1:
+        return lambda row: (str(row[0]), row[1])
+    return lambda row: (','.join(map(str, row[:-1])), row[-1])
+@lru_cache(maxsize=None)
+def _get_param_count(func: Any) -> int:
+    """
+    :return: the number of parameters of `func`, inspected once per function.
+    """
+    return len(signature(func).parameters)
 def get_rel_select_tuple(func: Any, instance: Base | None = None, sess: Session | None = None) -> Any:
     """
     Call a function with the given arguments and keyword arguments.
@@ -36,12 +82,12 @@ def get_rel_select_tuple(func: Any, instance: Base | None = None, sess: Session
     """
     obj = None
     if callable(func):
-        sig = signature(func)
-        if len(sig.parameters) == 1:
+        param_count = _get_param_count(func)
+        if param_count == 1:
             if instance is None:
                 raise TypeError(f"Function {func} requires an instance as an argument")
             obj = func(instance)
-        elif len(sig.parameters) == 2:
+        elif param_count == 2:
             if instance is None or sess is None:
                 raise TypeError(f"Function {func} requires an instance and a session as arguments")
             obj = func(instance, sess)
@@ -104,12 +150,14 @@ def fetch_tabledata(Model: type[Base], db_session: Session) -> dict[str, Any]:
     table_dict['pks'] = list()
     table_dict['data'] = list()
 
-    instances = db_session.scalars(select(Model)).all()
-    for instance in instances:
-        mapper = inspect(instance)
-        table_dict['pks'].append(
-            ','.join([str(pk) for pk in mapper.identity]) # type: ignore
-        )
+    stmt = _table_stmts.get(Model)
+    if stmt is None:
+        stmt = _table_stmts[Model] = select(*Model.__mapper__.primary_key, Model).options(*Model.get_preload_options())
+    # rows are the primary key values followed by the instance
+    split_row = _get_row_splitter(Model)
+    for row in db_session.execute(stmt).all():
+        pks, instance = split_row(row)
+        table_dict['pks'].append(pks)
         table_dict['data'].append(
             [
                 fetch_viewable_value(instance, header_key, db_session) 
@@ -324,11 +372,52 @@ def fetch_related_objects(instance: Base, db_session: Session, viewer: str = _de
                     None
                 )
     return related_objects
-def fetch_select_list(Model: type[Base], db_session: Session, instance: Base | None = None, info: dict[str, Any] = {}) -> list[tuple[str, str]]:
+@lru_cache(maxsize=None)
+def _get_stable_value(value: Any) -> Any:
     """
-    :return: a list of tuples containing the primary key and name of the Model.
+    :return: a value identifying `value` by what it selects instead of by its id, e.g.
+        - `'InstrumentedAttribute:Contract.contract_name'` for a column attribute,
+        - the module, qualified name and first line of a function with the values it closes over.
+
+    .. notes:: the cache keeps `value` alive, an address in a default repr cannot be taken by another object.
+    """
+    if isinstance(value, tuple):
+        return tuple(_to_stable_value(v) for v in value)
+    if isinstance(value, FunctionType):
+        closure = tuple(_to_stable_value(cell.cell_contents) for cell in value.__closure__ or ())
+        return (value.__module__, value.__qualname__, value.__code__.co_firstlineno, closure)
+    return f'{type(value).__name__}:{value}'
+def _to_stable_value(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    try:
+        return _get_stable_value(value)
+    except TypeError: # unhashable, e.g. a list
+        return f'{type(value).__name__}:{value!r}'
+def get_select_list_key(Model: type[Base], info: Mapping[str, Any]) -> tuple[Any, ...]:
     """
-    stmt = select(Model)
+    :return: a hashable key for the select list `fetch_select_list` builds from `Model` and `info`,
+    made of the table and class names and the stable values of the options, see `_get_stable_value`.
+    Relationships sharing a key get identical option lists.
+    """
+    key: list[Any] = [Model.__tablename__, Model.__name__]
+    for opt in ('join', 'order_by', 'where', 'distinct', 'limit', 'offset'):
+        key.append(_to_stable_value(info.get(opt, None)))
+    return tuple(key)
+def get_select_stmt(Model: type[Base], db_session: Session, instance: Base | None = None, info: Mapping[str, Any] = _empty_info) -> Any:
+    """
+    :return: the select statement of `fetch_select_list` for `Model` and `info`, selecting the primary key columns and the instance.
+    .. notes:: statements whose join, order_by and where do not depend on the instance or session are cached.
+    """
+    list_key = get_select_list_key(Model, info)
+    stmt = _select_stmts.get(list_key)
+    if stmt is not None:
+        return stmt
+    # option labels come from `str(model)`, eagerly loaded collections are not needed
+    stmt = select(*Model.__mapper__.primary_key, Model).options(*(
+        lazyload(rel.class_attribute) for rel in Model.__mapper__.relationships
+        if rel.uselist and rel.lazy != 'select'
+    ))
     join_clause = info.get('join', None)
     order_by = info.get('order_by', None)
     where_clause = info.get('where', None)
@@ -345,12 +434,33 @@ def fetch_select_list(Model: type[Base], db_session: Session, instance: Base | N
         stmt = stmt.limit(info['limit'])
     if info.get('offset', False):
         stmt = stmt.offset(info['offset'])
-    models = db_session.scalars(stmt).all()
+    if all(
+        not callable(clause) or _get_param_count(clause) == 0 
+        for clause in (join_clause, order_by, where_clause)
+    ):
+        _select_stmts[list_key] = stmt
+    return stmt
+def fetch_select_list(Model: type[Base], db_session: Session, instance: Base | None = None, info: Mapping[str, Any] = _empty_info) -> list[tuple[str, str]]:
+    """
+    :return: a list of tuples containing the primary key and name of the Model.
+    .. notes:: lists of cached statements are cached until the next write, see `_select_lists`.
+    """
+    stmt = get_select_stmt(Model, db_session, instance, info)
+    translate = '_self' in Model.get_keys('translate')
+    list_key = get_select_list_key(Model, info)
+    cache_key = (list_key, app_session.get('LANG') if translate else None)
+    cached = _select_lists.get(cache_key)
+    if cached is not None and monotonic() - cached[1] < _select_lists_ttl:
+        return list(cached[0])
     pks_name_list = []
-    for model in models:
-        pks = ','.join([str(pk) for pk in inspect(model).identity]) # type: ignore
-        name = _(str(model), True) if '_self' in Model.get_keys('translate') else str(model)
-        pks_name_list.append((pks, name))
+    # rows are the primary key values followed by the instance
+    split_row = _get_row_splitter(Model)
+    for row in db_session.execute(stmt):
+        pks, model = split_row(row)
+        name = str(model)
+        pks_name_list.append((pks, _(name, True) if translate else name))
+    if list_key in _select_stmts and not db_session.info.get('select_lists_stale', False):
+        _select_lists[cache_key] = (list(pks_name_list), monotonic())
     return pks_name_list
 def fetch_select_options(Model:type[Base] | type[DataJson], db_session: Session, polymorphic_spec_only: bool = False, instance: Base | None = None) -> dict[str, list[tuple[Any, str]]]:
     """
@@ -361,27 +471,25 @@ def fetch_select_options(Model:type[Base] | type[DataJson], db_session: Session,
     """
     
     select_options = dict()
+    select_lists: dict[tuple[Any, ...], list[tuple[str, str]]] = dict()
     base_data_keys = set()
     if polymorphic_spec_only:
         base_data_keys = Model.get_keys('polybase_data')
     polymorphic_spec_only = polymorphic_spec_only and bool(base_data_keys)
     if issubclass(Model, Base):
         # Extract foreign key col and referenced pks and name tuple for each relationship
-        mapper = Model.__mapper__
-        for rel in mapper.relationships:
-            pks_name_list = []
-            if rel.uselist or rel.secondary is not None:
-                continue
-            ref_Model = rel.entity.class_
-            local_col_key = next(iter(rel.local_columns)).key
+        for local_col_key, ref_Model, rel_info in Model.get_fk_rels():
             if local_col_key in base_data_keys:
                 continue
-            pks_name_list = fetch_select_list(
-                ref_Model, 
-                db_session,
-                instance=instance,
-                info=rel.info
-            ) 
+            list_key = get_select_list_key(ref_Model, rel_info)
+            pks_name_list = select_lists.get(list_key)
+            if pks_name_list is None:
+                pks_name_list = select_lists[list_key] = fetch_select_list(
+                    ref_Model, 
+                    db_session,
+                    instance=instance,
+                    info=rel_info
+                ) 
             select_options[local_col_key] = pks_name_list
         
         # Extract Enum types and get options from Enum definition
@@ -397,14 +505,14 @@ def fetch_select_options(Model:type[Base] | type[DataJson], db_session: Session,
         for rel_key, rel_info in Model.rel_info.items(): # type: ignore
             ref_Model = rel_info.get('ref_table')
             local_col_key = rel_info.get('local_col')
-            s_join = rel_info.get('join', None)
-            s_order_by = rel_info.get('order_by', None)
-            s_where = rel_info.get('where', None)
-            pks_name_list = fetch_select_list(
-                ref_Model, # type: ignore
-                db_session,
-                info=rel_info
-            )
+            list_key = get_select_list_key(ref_Model, rel_info) # type: ignore
+            pks_name_list = select_lists.get(list_key)
+            if pks_name_list is None:
+                pks_name_list = select_lists[list_key] = fetch_select_list(
+                    ref_Model, # type: ignore
+                    db_session,
+                    info=rel_info
+                )
             select_options[local_col_key] = pks_name_list
         # Extract Enum types and get options from Enum definition
         enum_keys = Model.get_keys('Enum')
@@ -527,6 +635,12 @@ def fetch_related_funcs(table_name: str, db_session: Session, func_type: str = '
     if table_name not in Base.func_map:
         return dict()
     func_inputs = dict()
+    select_lists: dict[str, list[tuple[str, str]]] = dict() # one query per referenced table
+    def get_select_list(select_table: str) -> list[tuple[str, str]]:
+        select_list = select_lists.get(select_table)
+        if select_list is None:
+            select_list = select_lists[select_table] = fetch_select_list(Base.model_map[select_table], db_session)
+        return select_list
     for func_name, func_info in Base.func_map[table_name].items():
         if func_info['func_type'] != func_type:
             continue
@@ -537,14 +651,14 @@ def fetch_related_funcs(table_name: str, db_session: Session, func_type: str = '
                 _(table_name, True), # name
                 '', # value
                 True, # is_required
-                fetch_select_list(Base.model_map[table_name], db_session) # select_list
+                get_select_list(table_name) # select_list
             )
         for param_name, param_info in func_info['input_types'].items():       
             param_type_info = param_info[0].split('.')
             param_type = param_type_info[0]
             if param_type == '_id':
                 select_table = param_type_info[1]
-                select_list = fetch_select_list(Base.model_map[select_table], db_session)
+                select_list = get_select_list(select_table)
                 func_input[param_name] = (
                     'select', # tag
                     _(param_name, True), # name
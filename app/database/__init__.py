@@ -11,7 +11,7 @@ from .models import Cache, Base, table_map
 if Config.SQLALCHEMY_DATABASE_URI is None:
     raise ValueError("Invalid SQLALCHEMY_DATABASE_URI in env file")
 
-engine = create_engine(Config.SQLALCHEMY_DATABASE_URI, echo=True if Config.DEBUG=='True' else False)
+engine = create_engine(Config.SQLALCHEMY_DATABASE_URI, echo=Config.DEBUG)
 
 db_session = scoped_session(
     sessionmaker(
@@ -53,11 +53,51 @@ from sqlalchemy import insert, text, delete, select, update, union_all
 from sqlalchemy.orm import reconstructor, mapped_column, relationship, aliased, object_session
 from sqlalchemy.orm import Mapped, Session
 
-from app.utils import xirr, get_stock_price
+from app.utils import xirr, get_stock_price, get_stock_prices
 
 from ..base import Base, Cache
 from .types import AccountType, Amounts, Gender, AssetType, AccountTransactionType
 
+def _fetch_stock_prices(instances: Iterable['HistoryAccuAssetTransaction']) -> dict[tuple[str, date], float | None]:
+    """
+    :return: { (stock code, record date): price } of the public stocks among `instances`,
+    downloaded in one batch per record date.
+    """
+    codes_by_date: dict[date, set[str]] = {}
+    for instance in instances:
+        if isinstance(instance.asset, PublicStock) and instance.asset.code:
+            codes_by_date.setdefault(instance.record_date, set()).add(instance.asset.code)
+    prices: dict[tuple[str, date], float | None] = {}
+    for dt, codes in codes_by_date.items():
+        for code, price in get_stock_prices(codes, dt).items():
+            prices[(code, dt)] = price
+    return prices
+
+def _is_ascii_digits(*fields: str) -> bool:
+    return all(field.isascii() and field.isdigit() for field in fields)
+
+def _parse_statement_date(value: str, fmt: str) -> date:
+    """
+    :return: the date of `value` written in `fmt`.
+    :raise ValueError: if `value` does not match `fmt`.
+
+    .. notes:: the zero-padded formats of the bank statements are sliced directly, 
+    anything else, including any value the slicing is not sure about, goes through `datetime.strptime`.
+    """
+    ymd = None
+    if fmt == '%d/%m/%Y' and len(value) == 10 and value[2] == value[5] == '/':
+        ymd = (value[6:10], value[3:5], value[0:2])
+    elif fmt == '%Y/%m/%d %H:%M' and len(value) == 16 and value[4] == value[7] == '/' and value[10] == ' ' and value[13] == ':':
+        hour, minute = value[11:13], value[14:16]
+        if _is_ascii_digits(hour, minute) and int(hour) < 24 and int(minute) < 60:
+            ymd = (value[0:4], value[5:7], value[8:10])
+    if ymd is not None and _is_ascii_digits(*ymd):
+        try:
+            return date(int(ymd[0]), int(ymd[1]), int(ymd[2]))
+        except ValueError:
+            pass
+    return datetime.strptime(value, fmt).date()
+
 
 class Asset(Base):
     __tablename__ = 'asset'
@@ -572,8 +612,7 @@ class AccountTransaction(Base):
                     data = {}
                     if 'Transaction Date' in row and row['Transaction Date']:
                         try:
-                            dt = datetime.strptime(row['Transaction Date'].strip('"'), "%d/%m/%Y")
-                            data['transaction_date'] = dt.date()
+                            data['transaction_date'] = _parse_statement_date(row['Transaction Date'].strip('"'), '%d/%m/%Y')
                         except Exception:
                             return {'success': False, 'error': 'Invalid date format in row'}
                     else:
@@ -604,8 +643,7 @@ class AccountTransaction(Base):
                     data = {}
                     if 'Value Date' in row and row['Value Date']:
                         try:
-                            dt = datetime.strptime(row['Value Date'].strip('"'), "%d/%m/%Y")
-                            data['transaction_date'] = dt.date()
+                            data['transaction_date'] = _parse_statement_date(row['Value Date'].strip('"'), '%d/%m/%Y')
                         except Exception:
                             return {'success': False, 'error': 'Invalid date format in row'}
                     else:
@@ -632,8 +670,7 @@ class AccountTransaction(Base):
                 for row in reader:
                     data = {}
                     try:
-                        dt = datetime.strptime(row['交易时间'].strip('"').strip(), "%Y/%m/%d %H:%M")
-                        data['transaction_date'] = dt.date()
+                        data['transaction_date'] = _parse_statement_date(row['交易时间'].strip('"').strip(), '%Y/%m/%d %H:%M')
                     except Exception:
                         return {'success': False, 'error': 'Invalid date format in row'}
                     if row['收/支'] in ['收入', '支出']:
@@ -915,12 +952,16 @@ class Currency(Base, Cache):
         Update the exchange rate as of today for all currencies.
         """
         try:
+            to_fetch = []
             for currency in currencies:
                 if currency.code in {'USD', 'USDT'}:
                     if currency.ex_rate != 1.0:
                         currency.ex_rate = 1.0
                     continue
-                rate = get_stock_price(f'{currency.code}USD=X')
+                to_fetch.append(currency)
+            rates = get_stock_prices(f'{currency.code}USD=X' for currency in to_fetch)
+            for currency in to_fetch:
+                rate = rates[f'{currency.code}USD=X']
                 if rate:
                     currency.ex_rate = rate
             db_session.flush()
@@ -1832,9 +1873,10 @@ class BrokerageAccountExternalTransaction(Base, Cache):
             )
         )
         instances = db_session.scalars(stmt).all()
+        stock_prices = _fetch_stock_prices(instances)
         for instance in instances:
             if isinstance(instance.asset, PublicStock) and instance.asset.code:
-                stock_price = get_stock_price(instance.asset.code, instance.record_date)
+                stock_price = stock_prices.get((instance.asset.code, instance.record_date))
                 if stock_price:
                     instance.unit_price = stock_price
                     instance.market_value = stock_price * instance.quantity
@@ -1920,16 +1962,21 @@ class HistoryExRate(Base, Cache):
             code_dates = code_dates - existing_code_dates
         values = []
         try:
+            codes_by_date: dict[date, list[str]] = {}
             for c, dt in code_dates:
                 if c in {'USD', 'USDT'} or dt > date.today():
                     continue
-                r = get_stock_price(f'{c}USD=X', dt)
-                if r:
-                    values.append({
-                        'currency_code': c,
-                        'ex_date': dt,
-                        'ex_rate': r
-                    })
+                codes_by_date.setdefault(dt, []).append(c)
+            for dt, codes in codes_by_date.items():
+                rates = get_stock_prices((f'{c}USD=X' for c in codes), dt)
+                for c in codes:
+                    r = rates[f'{c}USD=X']
+                    if r:
+                        values.append({
+                            'currency_code': c,
+                            'ex_date': dt,
+                            'ex_rate': r
+                        })
             # Insert the new exchange rates into the history exchange rate table
             if values:
                 values = sorted(values, key=lambda x: (x['ex_date'], x['currency_code']))
@@ -2094,9 +2141,10 @@ class HistoryAccuAssetTransaction(Base, Cache):
         )
         instances = db_session.scalars(stmt).all()
         try:
+            stock_prices = _fetch_stock_prices(instances)
             for instance in instances:
                 if isinstance(instance.asset, PublicStock) and instance.asset.code:
-                    stock_price = get_stock_price(instance.asset.code, instance.record_date)
+                    stock_price = stock_prices.get((instance.asset.code, instance.record_date))
                     if stock_price:
                         instance.unit_price = stock_price
                         instance.market_value = stock_price * instance.quantity
@@ -4,22 +4,26 @@ __all__ = ['Base', 'DataJson']
 
 # python
 import inspect as python_inspect
-from typing import Any, Optional
+from typing import Any, Callable, Mapping, Optional
 from datetime import date # in use eval('date')
 from enum import Enum # in use eval('Enum')
 import json
 from abc import ABC, abstractmethod
 import logging
+from operator import attrgetter
 logger = logging.getLogger(__name__)
 
 # sqlalchemy
 from sqlalchemy import delete, insert, inspect, update
 from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy.orm import DeclarativeBase, Session
+from sqlalchemy.orm import DeclarativeBase, Session, selectinload
 
 # app
 from app.utils.common import args_to_dict
-from .utils import serialize_value, convert_value_by_python_type
+from .utils import serialize_value, get_converter, get_serializer
+
+_base_data_types = frozenset({'date', 'int', 'float', 'bool', 'set', 'list', 'dict', 'str', 'tuple', 'DataJson', 'Enum'})
+_datajson_data_types = frozenset({'date', 'json', 'int', 'float', 'bool', 'set', 'list', 'dict', 'str', 'DataJson', 'Enum'})
 
 class Cache:
     __abstract__ = True
@@ -82,12 +86,15 @@ class Base(DeclarativeBase):
     - rules for making subclass of Base:
         - table column name **MUST** be the same as the property name.
         - each subclass **MUST** have a _name property to represent itself.
+    - models cannot use `__slots__` or be compiled to extension types: SQLAlchemy instrumentation
+      keeps the instance state and loaded values in the instance `__dict__`.
+      per-row work is kept down instead by the per-class caches (`get_col_getter`, `get_serializers`).
 
     :cvar model_map: { database table name: Class name of the model }
     :cvar key_info: Dictionary and cache of column information valued by keys.
     :cvar rel_info: Dictionary of relationship information.
     """
-    model_map: dict[str, type['Base']] = {}
+    model_map: Mapping[str, type['Base']] = {}
     """
     a dictionary of model classes, used to identify the class from the __tablename__ key in the data dictionary.
 
@@ -179,16 +186,37 @@ class Base(DeclarativeBase):
         if cls.key_info is NotImplemented:
             cls.key_info = dict()
 
+    @classmethod
+    def get_modifiable_types(cls) -> dict[str, type | None]:
+        """
+        :return: the python type of each modifiable key, None if the attribute has no column type.
+
+        .. notes:: the result is cached on the class after the first get.
+        """
+        modifiable_types = cls.__dict__.get('_modifiable_types')
+        if modifiable_types is None:
+            modifiable_types = dict()
+            for key in cls.get_keys('modifiable'):
+                attr = getattr(cls, key, None)
+                if attr is None:
+                    continue
+                try:
+                    attr_type = attr.type.python_type # assume all modifiable attributes are of type ColumnProperty
+                except:
+                    attr_type = None
+                modifiable_types[key] = attr_type
+            cls._modifiable_types = modifiable_types
+        return modifiable_types
+
     @classmethod
     def convert_value_by_data_type(cls, key: str, value: Any) -> Any:
-        if key not in cls.get_keys('modifiable'):
+        modifiable_types = cls.get_modifiable_types()
+        if key not in modifiable_types:
             raise AttributeError(f'Key {key} is not modifiable for {cls}')
-        attr = getattr(cls, key)
-        try:
-            attr_type = attr.type.python_type # assume all modifiable attributes are of type ColumnProperty
-        except:
+        attr_type = modifiable_types[key]
+        if attr_type is None:
             return value
-        return convert_value_by_python_type(value, attr_type)
+        return get_converter(attr_type)(value)
     
     def update_data(self, data: str | dict | None = None, **kwargs: Any) -> None:
         """
@@ -238,10 +266,12 @@ class Base(DeclarativeBase):
                     sess.execute(delete(old_cls.__table__).where(*conditions)) # type: ignore
                 base_update_dict = dict()
                 new_update_dict = dict()
+                base_modifiable_keys = poly_base_cls.get_keys('modifiable')
+                new_modifiable_keys = new_cls.get_keys('modifiable')
                 for key in args_dict:
-                    if key in poly_base_cls.get_keys('modifiable'):
+                    if key in base_modifiable_keys:
                         base_update_dict[key] = poly_base_cls.convert_value_by_data_type(key, args_dict[key])
-                    elif key in new_cls.get_keys('modifiable'):
+                    elif key in new_modifiable_keys:
                         new_update_dict[key] = new_cls.convert_value_by_data_type(key, args_dict[key])
                 pk_conditions = [
                     poly_base_cls.__table__.columns[pk_col.key]==pk_value 
@@ -253,8 +283,9 @@ class Base(DeclarativeBase):
                         new_update_dict[key] = value
                     sess.execute(insert(new_cls).values(**new_update_dict))
                 return
+        modifiable_keys = self.get_keys('modifiable')
         for key, value in args_dict.items():
-            if key in self.get_keys('modifiable'):
+            if key in modifiable_keys:
                 setattr(self, key, old_cls.convert_value_by_data_type(key, value))
 
     @classmethod
@@ -275,24 +306,35 @@ class Base(DeclarativeBase):
         """
         :return: the base class of the polymorphic class. None if not polymorphic.
         """
-        insp = inspect(cls)
-        if insp.polymorphic_identity is None:
-            return None
-        base_mapper = insp.base_mapper
-        base_cls = base_mapper.class_
-        if base_cls is None or base_mapper.polymorphic_on is None:
-            return cls
-        else:
-            return base_cls
+        p_base = cls.__dict__.get('_polymorphic_base', NotImplemented)
+        if p_base is NotImplemented:
+            insp = inspect(cls)
+            if insp.polymorphic_identity is None:
+                p_base = None
+            else:
+                base_mapper = insp.base_mapper
+                base_cls = base_mapper.class_
+                if base_cls is None or base_mapper.polymorphic_on is None:
+                    p_base = cls
+                else:
+                    p_base = base_cls
+            cls._polymorphic_base = p_base
+        return p_base
 
     @classmethod
     def get_polymorphic_key(cls) -> str:
         """
         :return: the key of the polymorphic class. Empty string if not polymorphic.
         """
-        if inspect(cls).polymorphic_identity is not None:
-            return inspect(cls).polymorphic_on.name # type: ignore
-        return ''
+        p_key = cls.__dict__.get('_polymorphic_key')
+        if p_key is None:
+            insp = inspect(cls)
+            if insp.polymorphic_identity is not None:
+                p_key = insp.polymorphic_on.name # type: ignore
+            else:
+                p_key = ''
+            cls._polymorphic_key = p_key
+        return p_key
     
     @classmethod
     def get_col_rel_map(cls) -> dict[str, str]:
@@ -303,18 +345,66 @@ class Base(DeclarativeBase):
         ```python
             { 'entity_id': 'entity', 'old_entity_id': 'old_entity' }
         ```
-        """
-        crm = dict()
-        base_data_keys = set()
 
-        for r in cls.__mapper__.relationships:
-            local_col = next(iter(r.local_columns))
-            local_col_key = local_col.key
-            cond = (not r.uselist) and (r.secondary is None) and (local_col.foreign_keys)
-            if cond and local_col_key:
-                crm[local_col_key] = r.key
+        .. notes:: the result is cached on the class after the first get.
+        """
+        crm = cls.__dict__.get('_col_rel_map')
+        if crm is None:
+            crm = dict()
+            for r in cls.__mapper__.relationships:
+                local_col = next(iter(r.local_columns))
+                local_col_key = local_col.key
+                cond = (not r.uselist) and (r.secondary is None) and (local_col.foreign_keys)
+                if cond and local_col_key:
+                    crm[local_col_key] = r.key
+            cls._col_rel_map = crm
         return crm
 
+    @classmethod
+    def get_fk_rels(cls) -> tuple[tuple[str, type['Base'], dict[str, Any]], ...]:
+        """
+        :return: tuples of local column key, referenced class and relationship info 
+            for each single relationship without a secondary table.
+
+        .. notes:: the result is cached on the class after the first get.
+        """
+        fk_rels = cls.__dict__.get('_fk_rels')
+        if fk_rels is None:
+            fk_rels = cls._fk_rels = tuple(
+                (next(iter(rel.local_columns)).key, rel.entity.class_, rel.info)
+                for rel in cls.__mapper__.relationships
+                if not rel.uselist and rel.secondary is None
+            )
+        return fk_rels
+
+    @classmethod
+    def get_preload_options(cls) -> tuple[Any, ...]:
+        """
+        :return: `selectinload` options for listing the class in a table, covering
+            - the lazily loaded relationships among the headers, and
+            - the dotted relationship paths in `key_info['preload']`, e.g. `'amendments.clauses'`.
+
+        .. notes:: the result is cached on the class after the first get.
+        """
+        options = cls.__dict__.get('_preload_options')
+        if options is None:
+            paths = [
+                rel.key for rel in cls.__mapper__.relationships
+                if rel.key in cls.get_headers() and rel.lazy == 'select'
+            ]
+            paths.extend(sorted(cls.key_info.get('preload', set())))
+            opts = []
+            for path in paths:
+                opt = None
+                Model = cls
+                for key in path.split('.'):
+                    attr = getattr(Model, key)
+                    opt = selectinload(attr) if opt is None else opt.selectinload(attr)
+                    Model = attr.property.mapper.class_
+                opts.append(opt)
+            options = cls._preload_options = tuple(opts)
+        return options
+
     @classmethod
     def get_keys(cls, *args: str) -> set[str]:
         """
@@ -342,7 +432,7 @@ class Base(DeclarativeBase):
                 if p_base:
                     info_keys.update(p_base.data_list)
                     keys.update(info_keys)
-                    cls.key_info[info] = info_keys
+                cls.key_info[info] = info_keys
             elif info == 'pk':
                 info_keys = set()
                 for col in cls.__mapper__.primary_key:
@@ -365,7 +455,7 @@ class Base(DeclarativeBase):
                 info_keys = set(cls.data_list) - cls.get_keys('hidden')
                 cls.key_info[info] = info_keys
                 keys.update(info_keys)
-            elif info in {'date', 'int', 'float', 'bool', 'set', 'list', 'dict', 'str', 'tuple' 'DataJson', 'Enum'}:
+            elif info in _base_data_types:
                 info_keys = set()
                 for key in set(cls.data_list) - cls.get_keys('single_rel'):
                     attr = python_inspect.getattr_static(cls, key)
@@ -430,51 +520,102 @@ class Base(DeclarativeBase):
     @classmethod
     def convert_dict_by_attr_type(cls, data: dict[str, Any]) -> dict[str, Any]:
         conv_data = dict()
+        data_keys = set(cls.data_list)
+        readonly_keys = cls.get_keys('readonly')
         for key, value in data.items():
             converted_value = value
-            if key in cls.data_list:
-                readonly_keys = cls.get_keys('readonly')
+            if key in data_keys:
                 if key in readonly_keys:
                     raise AttributeError(f'Key {key} is readonly for {cls}')
                 attr = getattr(cls, key, None)
                 if attr is None:
                     raise AttributeError(f'Invalid key {key} for {cls}')
                 if hasattr(attr, 'type') and hasattr(attr.type, 'python_type'):
-                    converted_value = convert_value_by_python_type(value, attr.type.python_type)
+                    converted_value = get_converter(attr.type.python_type)(value)
                 conv_data[key] = converted_value
         return conv_data
     
+    @classmethod
+    def get_serializers(cls) -> tuple[tuple[str, Callable[[Any], Any]], ...]:
+        """
+        :return: pairs of column key and the serializer chosen for the column's python type.
+
+        .. notes:: the result is cached on the class after the first get.
+        """
+        serializers = cls.__dict__.get('_serializers')
+        if serializers is None:
+            pairs = []
+            for key, col in cls.__mapper__.columns.items():
+                try:
+                    python_type = col.type.python_type
+                except NotImplementedError:
+                    python_type = None
+                pairs.append((key, get_serializer(python_type)))
+            serializers = cls._serializers = tuple(pairs)
+        return serializers
+
+    @classmethod
+    def get_col_getter(cls) -> tuple[tuple[str, ...], Callable[[Any], tuple[Any, ...]]]:
+        """
+        :return: the column keys and a getter fetching their values from an instance in one call.
+
+        .. notes:: the result is cached on the class after the first get.
+        """
+        col_getter = cls.__dict__.get('_col_getter')
+        if col_getter is None:
+            col_keys = tuple(cls.__mapper__.columns.keys())
+            if len(col_keys) == 1:
+                getter = lambda obj, key=col_keys[0]: (getattr(obj, key),)
+            else:
+                getter = attrgetter(*col_keys)
+            col_getter = cls._col_getter = (col_keys, getter)
+        return col_getter
+
     def data_dict(self, serializeable: bool = False) -> dict[str, Any]:
         """
         :return: a dictionary containing data of the instance.
         :param serializeable: if True, the data is serialized to allowed types for JSON.
         """
+        return self.data_dict_serialized() if serializeable else self.data_dict_raw()
+
+    def data_dict_raw(self) -> dict[str, Any]:
+        """
+        :return: a dictionary containing column values of the instance as they are.
+        """
         data_dict = {'__tablename__': self.__tablename__}
-        for data_key in self.__class__.__mapper__.columns.keys():
-            value = getattr(self, data_key, None)
-            if value is None and serializeable:
-                data_dict[data_key] = ''
-            elif serializeable:        
-                data_dict[data_key] = serialize_value(value)
-            else:
-                data_dict[data_key] = value
-        return data_dict  
+        col_keys, getter = self.get_col_getter()
+        data_dict.update(zip(col_keys, getter(self)))
+        return data_dict
+
+    def data_dict_serialized(self) -> dict[str, Any]:
+        """
+        :return: a dictionary containing column values of the instance serialized to allowed types for JSON.
+        """
+        data_dict = {'__tablename__': self.__tablename__}
+        _, getter = self.get_col_getter()
+        for (data_key, serializer), value in zip(self.get_serializers(), getter(self)):
+            data_dict[data_key] = '' if value is None else serializer(value)
+        return data_dict
     
     @classmethod
     def get_col_datajson_id_map(cls) -> dict[str, str]:
         """
         :return: dict {DataJson_local_col.key: DataJson_id_col.key }
-        """
-        ele_id_map = dict()
-        for key in cls.get_keys('DataJson'):
-            attr = getattr(cls, key)
-            if hasattr(attr, 'info'):
-                element_key = attr.info.get('DataJson_id_key', None)
-                if element_key is None:
-                    ele_id_map[key] = None
-                else:
-                    ele_id_map[element_key] = key
 
+        .. notes:: the result is cached on the class after the first get.
+        """
+        ele_id_map = cls.__dict__.get('_col_datajson_id_map')
+        if ele_id_map is None:
+            ele_id_map = dict()
+            for key in cls.get_keys('DataJson'):
+                attr = getattr(cls, key)
+                if hasattr(attr, 'info'):
+                    element_key = attr.info.get('DataJson_id_key', None)
+                    if element_key is None:
+                        ele_id_map[key] = None
+                    else:
+                        ele_id_map[element_key] = key
+            cls._col_datajson_id_map = ele_id_map
         return ele_id_map
 
 class DataJson(ABC):
@@ -588,7 +729,7 @@ class DataJson(ABC):
         :return: json string of the data dictionary.
         :raise AttributeError: if the data is not valid for this class.
         """
-        return json.dumps(self.data_dict(serializeable=True))
+        return json.dumps(self.data_dict_serialized())
     
     @classmethod
     def get_cls_from_dict(cls, data: dict[str, Any]) -> type['DataJson']:
@@ -616,7 +757,7 @@ class DataJson(ABC):
             raise AttributeError(f'Missing required keys: {missing_keys} in {data}')
         
         readonly_keys = data_json_cls.get_keys('readonly')
-        if (readonly_keys - (readonly_keys - data.keys())):
+        if not readonly_keys.isdisjoint(data):
             raise AttributeError(f'Readonly keys: {readonly_keys} in {data}')
         return data_json_cls
 
@@ -635,13 +776,9 @@ class DataJson(ABC):
         data_json_cls = cls
         if cls.__datajson_id__ == NotImplemented:
             data_json_cls = cls.get_cls_from_dict(data)
-        data_dict = {}
-        data_dict['__datajson_id__'] = data_json_cls.__datajson_id__
-        mod_keys = data_json_cls.get_keys('modifiable')
-
-        for key in mod_keys:
-            value = data.get(key, None)
-            data_dict[key] = data_json_cls.convert_value_by_attr_type(value, key) # type: ignore
+        data_dict = {'__datajson_id__': data_json_cls.__datajson_id__}
+        convert = data_json_cls.convert_value_by_attr_type
+        data_dict.update({key: convert(data.get(key), key) for key in data_json_cls.get_keys('modifiable')})
         return data_dict
 
     @classmethod
@@ -655,31 +792,74 @@ class DataJson(ABC):
         """
         if value is None or value == '':
             return None
-        attr = getattr(cls, attr_key, None)
-        if attr is None:
-            raise AttributeError(f'Attribute {attr_key} not found in {cls}')
-        attr_type = type(attr)
-        converted_value = convert_value_by_python_type(value, attr_type)    
+        attr_type = cls.get_attr_types().get(attr_key)
+        if attr_type is None:
+            attr = getattr(cls, attr_key, None)
+            if attr is None:
+                raise AttributeError(f'Attribute {attr_key} not found in {cls}')
+            attr_type = type(attr)
+        converted_value = get_converter(attr_type)(value)
         return converted_value
+
+    @classmethod
+    def get_attr_types(cls) -> dict[str, type]:
+        """
+        :return: the type of the class attribute of each data key, keys without one are left out.
+
+        .. notes:: the result is cached on the class after the first get.
+        """
+        attr_types = cls.__dict__.get('_attr_types')
+        if attr_types is None:
+            attr_types = dict()
+            for key in cls.get_keys('data'):
+                attr = getattr(cls, key, None)
+                if attr is not None:
+                    attr_types[key] = type(attr)
+            cls._attr_types = attr_types
+        return attr_types
       
     def data_dict(self, serializeable: bool = False) -> dict[str, Any]:
         """
         :return: a dictionary containing the data of the object.
         :param serializeable: If True, serialize the values in the dictionary.
         """
+        return self.data_dict_serialized() if serializeable else self.data_dict_raw()
 
-        data_keys = self.data_list
-        if self.__datajson_id__ is NotImplemented:
-            djid = 'data_json'
-        else:
-            djid = self.__datajson_id__
+    def data_dict_raw(self) -> dict[str, Any]:
+        """
+        :return: a dictionary containing the data of the object as they are.
+        """
+        data_keys = self.get_data_keys()
+        djid = 'data_json' if self.__datajson_id__ is NotImplemented else self.__datajson_id__
         data_dict = {'__datajson_id__': djid}
         for key, value in self.__dict__.items():
-            if key in data_keys:
-                attr = getattr(self, key, None)
-                if attr is not None:
-                    data_dict.update({key: serialize_value(value) if serializeable else value})
+            if key in data_keys and value is not None:
+                data_dict[key] = value
         return data_dict
+
+    def data_dict_serialized(self) -> dict[str, Any]:
+        """
+        :return: a dictionary containing the data of the object serialized to allowed types for JSON.
+        """
+        data_keys = self.get_data_keys()
+        djid = 'data_json' if self.__datajson_id__ is NotImplemented else self.__datajson_id__
+        data_dict = {'__datajson_id__': djid}
+        for key, value in self.__dict__.items():
+            if key in data_keys and value is not None:
+                data_dict[key] = serialize_value(value)
+        return data_dict
+
+    @classmethod
+    def get_data_keys(cls) -> frozenset[str]:
+        """
+        :return: the keys in `data_list` as a set for membership tests.
+
+        .. notes:: the result is cached on the class after the first get.
+        """
+        data_keys = cls.__dict__.get('_data_keys')
+        if data_keys is None:
+            data_keys = cls._data_keys = frozenset(cls.data_list)
+        return data_keys
     
     @classmethod
     def get_col_rel_map(cls) -> dict[str, str]:
@@ -755,7 +935,7 @@ class DataJson(ABC):
                 info_keys = set(cls.data_list) - cls.get_keys('hidden')
                 cls.key_info[info] = info_keys  # cache the result
                 keys.update(info_keys)
-            elif info in {'date', 'json', 'int', 'float', 'bool', 'set', 'list', 'dict', 'str', 'DataJson', 'Enum'}:
+            elif info in _datajson_data_types:
                 info_keys = set()
                 for data_key in set(cls.data_list) - cls.get_keys('single_rel'):
                     attr = getattr(cls, data_key, None)  # type: ignore
@@ -1,15 +1,16 @@
 # app/database/contract/dbmodels.py
 import logging
 logger = logging.getLogger(__name__)
-from typing import Sequence
+from typing import Iterable, Sequence
 from datetime import date
 from sqlalchemy import ForeignKey
 from sqlalchemy import Date, Integer, Enum as SqlEnum
-from sqlalchemy import select
+from sqlalchemy import event, inspect, select
 from sqlalchemy.orm import Mapped
 from sqlalchemy.orm import mapped_column
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.util import identity_key
 from ..base import Base
 from .types import ClausePos
 from .types import ClauseType
@@ -43,6 +44,8 @@ class Contract(Base):
     contract_remarks: Mapped[str | None]
     contract_number_huawei: Mapped[str | None]
     
+    # plain FK one-to-many: selectin loads of amendments and amendment.clauses 
+    # already query the child table alone (omit_join is detected, and may only be set to False)
     amendments: Mapped[list['Amendment']] = relationship(
         back_populates = 'contract', 
         lazy = 'select',
@@ -76,10 +79,12 @@ class Contract(Base):
         secondaryjoin=lambda: Contract.contract_id == ContractLEGALMAPContract.child_contract_id,
         lazy='select'
     )
+    # read only shortcut through the amendments, expired by `_expire_contract_clauses` after amendment or clause changes
     clauses: Mapped[list['Clause']] = relationship(
         lazy='select',
         overlaps='amendments',
-        secondary=lambda: Amendment.__table__
+        secondary=lambda: Amendment.__table__,
+        viewonly=True
     )
     user_roles: Mapped[list['UserRole']] = relationship(
         secondary=lambda: UserRoleMAPContract.__table__,
@@ -90,18 +95,19 @@ class Contract(Base):
 
     @property
     def contract_signdate(self) -> date | None: # type: ignore
-        dates = [am.amendment_signdate for am in self.amendments]
-        if dates:
-            return min(dates)
-        return None
+        return self._fetch_amendment_min_date('amendment_signdate')
     
     @property
     def contract_effectivedate(self) -> date | None: # type: ignore
-        if self.amendments:
-            dates = [amendment.amendment_effectivedate for amendment in self.amendments]
-            if dates:
-                return min(dates)
-        return None
+        return self._fetch_amendment_min_date('amendment_effectivedate')
+
+    def _fetch_amendment_min_date(self, date_key: str) -> date | None:
+        """
+        :return: the earliest `date_key` among the amendments of the contract.
+        the amendments are loaded once and kept up to date by the session, 
+        listings preload them with their clauses, see `key_info['preload']`.
+        """
+        return min((getattr(amendment, date_key) for amendment in self.amendments), default=None)
     
     @property
     def contract_expirydate(self) -> date | None: # type: ignore
@@ -120,34 +126,43 @@ class Contract(Base):
         else:
             return self._fetch_contract_expirydate(set())
     
+    def _fetch_all_clauses(self) -> Iterable['Clause']:
+        """
+        :return: the clauses of all amendments of the contract.
+        through the amendments if they are already loaded or have unflushed changes, 
+        otherwise in one query of `clauses` instead of one query per amendment.
+        """
+        db_sess = Session.object_session(self)
+        if 'amendments' in self.__dict__ or db_sess is None or _has_amendment_changes(db_sess):
+            return (clause for amendment in self.amendments for clause in amendment.clauses)
+        return self.clauses
+
     @property
     def entities(self) -> set['Entity']: # type: ignore
         new_set = set()
         old_set = set()
-        for amendment in self.amendments:
-            for clause in amendment.clauses:
-                if clause.clause_type == ClauseType.CLAUSE_ENTITY:
-                    new_one = getattr(clause, 'new_entity', None)
-                    old_one = getattr(clause, 'old_entity', None)
-                    if new_one:
-                        new_set.add(new_one)
-                    if (old_one):
-                        old_set.add(old_one)
+        for clause in self._fetch_all_clauses():
+            if clause.clause_type == ClauseType.CLAUSE_ENTITY:
+                new_one = getattr(clause, 'new_entity', None)
+                old_one = getattr(clause, 'old_entity', None)
+                if new_one:
+                    new_set.add(new_one)
+                if (old_one):
+                    old_set.add(old_one)
         return new_set - old_set
 
     @property
     def scopes(self) -> set['Scope']: # type: ignore
         new_set = set()
         old_set = set()
-        for amendment in self.amendments:
-            for clause in amendment.clauses:
-                if clause.clause_type == ClauseType.CLAUSE_SCOPE:
-                    new_one = getattr(clause, 'new_scope', None)
-                    old_one = getattr(clause, 'old_scope', None)
-                    if new_one:
-                        new_set.add(new_one)
-                    if (old_one):
-                        old_set.add(old_one)
+        for clause in self._fetch_all_clauses():
+            if clause.clause_type == ClauseType.CLAUSE_SCOPE:
+                new_one = getattr(clause, 'new_scope', None)
+                old_one = getattr(clause, 'old_scope', None)
+                if new_one:
+                    new_set.add(new_one)
+                if (old_one):
+                    old_set.add(old_one)
         return new_set - old_set
 
     commercial_incentives: Mapped[list['ClauseCommercialIncentive']] = relationship(
@@ -281,7 +296,8 @@ class Contract(Base):
             'user_roles'
         },
         'longtext': {'contract_fullname', 'contract_remarks'},
-        'copylink': {'contract_number_huawei'}
+        'copylink': {'contract_number_huawei'},
+        'preload': {'amendments.clauses'}
     }
 class ContractMAPContract(Base):
     __tablename__ = 'contract__map__contract'
@@ -1148,3 +1164,49 @@ class ClauseApplicableLaw(Clause):
 
         
 
+def _has_amendment_changes(session: Session) -> bool:
+    """
+    :return: True if amendments or clauses are added, modified or deleted in `session` and not flushed yet.
+    """
+    return any(
+        isinstance(obj, (Amendment, Clause))
+        for changed in (session.new, session.dirty, session.deleted)
+        for obj in changed
+    )
+
+def _fk_values(obj: Base, key: str) -> set[int]:
+    """
+    :return: the current and the replaced values of the foreign key `key` of `obj` in this flush.
+    """
+    history = inspect(obj).attrs[key].history
+    return {value for values in (history.added, history.unchanged, history.deleted) for value in values if value is not None}
+
+@event.listens_for(Session, 'after_flush')
+def _expire_contract_clauses(session: Session, flush_context) -> None:
+    """
+    Expire `amendments` and `clauses` of the loaded contracts owning the amendments or clauses of the flush,
+    `clauses` is view only and changes made through foreign keys do not reach `amendments`.
+    """
+    contract_ids: set[int] = set()
+    amendment_ids: set[int] = set()
+    for changed in (session.new, session.dirty, session.deleted):
+        for obj in changed:
+            if isinstance(obj, Amendment):
+                contract_ids |= _fk_values(obj, 'contract_id')
+            elif isinstance(obj, Clause):
+                amendment_ids |= _fk_values(obj, 'amendment_id')
+    unknown_amendment_ids = set()
+    for amendment_id in amendment_ids:
+        amendment = session.identity_map.get(identity_key(Amendment, amendment_id))
+        if amendment is None:
+            unknown_amendment_ids.add(amendment_id)
+        else:
+            contract_ids |= _fk_values(amendment, 'contract_id')
+    if unknown_amendment_ids:
+        contract_ids.update(session.scalars(
+            select(Amendment.contract_id).where(Amendment.amendment_id.in_(unknown_amendment_ids))
+        ))
+    for contract_id in contract_ids:
+        contract = session.identity_map.get(identity_key(Contract, contract_id))
+        if contract is not None:
+            session.expire(contract, ['amendments', 'clauses'])
@@ -1,5 +1,6 @@
 # app/database/models.py
 __all__ = ['Base', 'Cache', 'table_map']
+from types import MappingProxyType
 from .base import Base, Cache
 
 table_map = {}
@@ -18,4 +19,6 @@ else:
 Base.model_map.update(mm)
 Base.func_map.update(fm)
 Cache.cache_map.extend(cm)
-table_map.update(tm)
\ No newline at end of file
+table_map.update(tm)
+# model_map is complete from here on, expose it read-only
+Base.model_map = MappingProxyType(Base.model_map)
@@ -14,7 +14,7 @@ class DataJsonType(TypeDecorator):
 
     def process_bind_param(self, value, dialect):
         if value is not None:
-            return value.data_dict(serializeable=True)
+            return value.data_dict_serialized()
         return value
 
     def process_result_value(self, value, dialect):
@@ -26,6 +26,7 @@ class DataJsonType(TypeDecorator):
 
 class TypeSetInt(TypeDecorator):
     impl = String
+    cache_ok = True # no constructor arguments, statements using it can be cached
 
     @property
     def python_type(self) -> type:
@@ -15,20 +15,12 @@ from .dbmodels import (
 )
 cache_map = []
 
-model_map = {
-    'user': User,
-    'user_role': UserRole,
-    'user__map__user_role': UserMAPUserRole,
-    'user_role__map__user_role': UserRoleMAPUserRole
-}
+_models = (User, UserRole, UserMAPUserRole, UserRoleMAPUserRole)
+
+model_map = {Model.__tablename__: Model for Model in _models}
 
 table_map = {
-    'user': [
-        'user',
-        'user_role',
-        'user__map__user_role',
-        'user_role__map__user_role'
-    ]
+    'user': list(model_map)
 }
 
 func_map = {}
\ No newline at end of file
@@ -1,13 +1,40 @@
 import bcrypt
-from sqlalchemy import ForeignKey, select
+from sqlalchemy import ForeignKey, Index, select
 from sqlalchemy.orm import Session
-from sqlalchemy.types import Integer
+from sqlalchemy.types import Integer, JSON
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import (
     Mapped,
-    mapped_column, relationship
+    mapped_column, relationship,
+    reconstructor, validates
 )
 from ..base import Base
 
+_bcrypt_max_bytes = 72 # bcrypt only uses the first 72 bytes of a password
+
+# permission letters in table_privilege strings and their bits in the privilege masks
+_privilege_bits = {'r': 1, 'w': 2, 'a': 4, 'm': 8, 'd': 16}
+
+def privilege_to_mask(table_privilege: dict[str, str] | None) -> dict[str, int]:
+    """
+    :return: { table name: bitmask } converted from { table name: permission letters, e.g. 'rw' }
+    """
+    if not table_privilege:
+        return {}
+    return {
+        table: sum(_privilege_bits.get(p, 0) for p in set(permissions))
+        for table, permissions in table_privilege.items()
+    }
+
+def mask_to_privilege(privilege_mask: dict[str, int]) -> dict[str, str]:
+    """
+    :return: { table name: permission letters } converted back from the bitmasks.
+    """
+    return {
+        table: ''.join(p for p, bit in _privilege_bits.items() if mask & bit)
+        for table, mask in privilege_mask.items()
+    }
+
 class User(Base):
     __tablename__ = 'user'
     user_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -63,10 +90,21 @@ class User(Base):
     
     @user_password.setter
     def user_password(self, pw: str):
-        self.user_password_hash = bcrypt.hashpw(pw.encode(), bcrypt.gensalt()).decode()
+        # same limit as check_password, older bcrypt versions would silently truncate instead
+        raw_pw = pw.encode()
+        if len(raw_pw) > _bcrypt_max_bytes:
+            raise ValueError(f'Password longer than {_bcrypt_max_bytes} bytes')
+        self.user_password_hash = bcrypt.hashpw(raw_pw, bcrypt.gensalt()).decode()
 
     def check_password(self, raw_password: str) -> bool:
-        return bcrypt.checkpw(raw_password.encode(), self.user_password_hash.encode())
+        # reject what bcrypt cannot match without hashing: empty input,
+        # input beyond bcrypt's 72-byte limit or a stored value that is not a bcrypt hash
+        if not raw_password or not self.user_password_hash:
+            return False
+        pw = raw_password.encode()
+        if len(pw) > _bcrypt_max_bytes or not self.user_password_hash.startswith('$2'):
+            return False
+        return bcrypt.checkpw(pw, self.user_password_hash.encode())
 
     data_list = [
         'user_name',
@@ -81,8 +119,18 @@ class User(Base):
     }
 class UserRole(Base):
     __tablename__ = 'user_role'
+    # JSONB and its GIN index only exist on PostgreSQL, other databases keep plain JSON
+    __table_args__ = (
+        Index('ix_role_priv_gin', 'table_privilege', postgresql_using='gin').ddl_if(dialect='postgresql'),
+    )
     user_role_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_role_name: Mapped[str]
+    table_privilege: Mapped[dict[str, str] | None] = mapped_column(JSON().with_variant(JSONB(), 'postgresql'))
+
+    _priv = None
+    """
+    cache of `table_privilege` as { table name: bitmask }, built on first use and reset on load and on assignment.
+    """
     
     users: Mapped[list['User']] = relationship(
         back_populates='user_roles',
@@ -121,6 +169,37 @@ class UserRole(Base):
             raise Exception("DB Session is required for User instantiation")
         stmt = select(UserRole).join(family_ids, UserRole.user_role_id == family_ids.c.id)
         return set(sess.scalars(stmt)) | {self}
+
+    @reconstructor
+    def _reset_privilege_mask(self) -> None:
+        self._priv = None
+
+    @validates('table_privilege')
+    def _validate_table_privilege(self, key: str, value: dict[str, str] | None) -> dict[str, str] | None:
+        self._priv = None
+        return value
+
+    @property
+    def privilege_mask(self) -> dict[str, int]:
+        """
+        :return: { table name: bitmask } of `table_privilege`.
+        """
+        if self._priv is None:
+            self._priv = privilege_to_mask(self.table_privilege)
+        return self._priv
+
+    def __add__(self, other: 'UserRole | dict[str, int]') -> dict[str, int]:
+        """
+        :return: the merged privilege bitmasks of this role and `other`.
+        :param other: another role or privilege bitmasks already merged, e.g. `sum(roles, {})`.
+        """
+        other_priv = other.privilege_mask if isinstance(other, UserRole) else other
+        merged = self.privilege_mask.copy()
+        for table, mask in other_priv.items():
+            merged[table] = merged.get(table, 0) | mask
+        return merged
+    __radd__ = __add__
+
     def __str__(self) -> str:
         return self.user_role_name
     
@@ -156,6 +235,11 @@ class UserMAPUserRole(Base):
     }
 class UserRoleMAPUserRole(Base):
     __tablename__ = 'user_role__map__user_role'
+    # primary key (child_id, parent_id) serves the ancestor step of role_family,
+    # the reversed index serves the descendant traversal (children)
+    __table_args__ = (
+        Index('ix_urmur_parent_child', 'parent_id', 'child_id'),
+    )
     child_id: Mapped[int] = mapped_column(Integer, ForeignKey('user_role.user_role_id'), primary_key=True)
     parent_id: Mapped[int] = mapped_column(Integer, ForeignKey('user_role.user_role_id'), primary_key=True)
     child: Mapped['UserRole'] = relationship(
@@ -1,14 +1,32 @@
 from datetime import date
+from functools import lru_cache
 from enum import Enum
-import json
-from typing import Any, Iterable
+try:
+    from orjson import loads as _json_loads # optional, faster parsing of json attributes
+except ImportError:
+    from json import loads as _json_loads
+from typing import Any, Callable, Iterable
 from sqlalchemy.orm.properties import ColumnProperty
 
+_identity = lambda value: value
+_exact_serializers: dict[type, Callable[[Any], Any]] = {
+    str: _identity,
+    int: _identity,
+    float: _identity,
+    bool: _identity,
+    date: date.isoformat
+}
+"""
+serializers of the most common value types by exact type, other types go through the checks of `serialize_value`.
+"""
+
 def serialize_value(attr: Any) -> Any:
     """
     convert the `attr` to a serializable value according to its data type.
     """
-    
+    serializer = _exact_serializers.get(type(attr))
+    if serializer is not None:
+        return serializer(attr)
     if isinstance(attr, ColumnProperty):
         attr_type = attr.type.python_type
     else:
@@ -29,6 +47,48 @@ def serialize_value(attr: Any) -> Any:
         srl_value = attr
     return srl_value if srl_value is not None else ''
 
+def get_serializer(python_type: type | None) -> Callable[[Any], Any]:
+    """
+    :return: a function converting a not-None value of `python_type` to a serializable value,
+             chosen once so that callers can skip the type checks of `serialize_value`.
+    :param python_type: the python type of a column, None if unknown.
+    """
+    from .base import DataJson
+    if python_type in (str, int, float, bool):
+        return _identity
+    elif python_type is date:
+        return lambda value: value.isoformat() if type(value) is date else serialize_value(value)
+    elif isinstance(python_type, type) and issubclass(python_type, Enum):
+        return lambda value: value.value if isinstance(value, python_type) else serialize_value(value)
+    elif isinstance(python_type, type) and issubclass(python_type, DataJson):
+        return lambda value: value.dumps() if isinstance(value, python_type) else serialize_value(value)
+    return serialize_value
+
+@lru_cache(maxsize=None)
+def get_converter(python_type: Any) -> Callable[[Any], Any]:
+    """
+    :return: a function converting a value to `python_type` like `convert_value_by_python_type`,
+             with the common string conversions chosen once per type instead of on each call.
+    :param python_type: the python type of an attribute.
+    """
+    if python_type is str:
+        return lambda value: (
+            value if type(value) is str and value != '' else convert_value_by_python_type(value, str)
+        )
+    elif python_type is int:
+        return lambda value: (
+            int(value.replace(',', '')) if type(value) is str and value != '' else convert_value_by_python_type(value, int)
+        )
+    elif python_type is float:
+        return lambda value: (
+            float(value.replace(',', '')) if type(value) is str and value != '' else convert_value_by_python_type(value, float)
+        )
+    elif python_type is date:
+        return lambda value: (
+            date.fromisoformat(value) if type(value) is str and value != '' else convert_value_by_python_type(value, date)
+        )
+    return lambda value: convert_value_by_python_type(value, python_type)
+
 def convert_value_by_python_type(value: Any, python_type: Any) -> Any:
     """
     convert the `value` by the `python_type`.
@@ -54,9 +114,9 @@ def convert_value_by_python_type(value: Any, python_type: Any) -> Any:
         converted_value = python_type(value)
     elif issubclass(python_type, dict) and (isinstance(value, str) or isinstance(value, DataJson)):
         if isinstance(value, str):
-            converted_value = json.loads(value)
+            converted_value = _json_loads(value)
         elif isinstance(value, DataJson):
-            converted_value = value.data_dict()
+            converted_value = value.data_dict_raw()
     elif issubclass(python_type, DataJson) and (isinstance(value, str) or isinstance(value, dict)):
         converted_value = DataJson.get_obj(value)
     elif issubclass(python_type, Enum):
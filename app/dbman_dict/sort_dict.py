@@ -1,6 +1,20 @@
 import json
 import os
 
+def _sort_items(items: dict) -> dict:
+    """
+    sort by code point when all keys are ASCII,
+    otherwise by the zh_CN collation of PyICU if it is installed.
+    """
+    if all(k.isascii() for k in items):
+        return dict(sorted(items.items()))
+    try:
+        import icu # type: ignore
+    except ImportError:
+        return dict(sorted(items.items()))
+    sort_key = icu.Collator.createInstance(icu.Locale('zh_CN')).getSortKey
+    return dict(sorted(items.items(), key=lambda kv: sort_key(kv[0])))
+
 def sort_json_dict(*filename: str):
     for fn in filename:
         if not os.path.isfile(fn):
@@ -11,8 +25,8 @@ def sort_json_dict(*filename: str):
         phrases = {k.lower(): v for k, v in data.items() if ' ' in k}
         singles = {k.lower(): v for k, v in data.items() if ' ' not in k}
 
-        sorted_phrases = dict(sorted(phrases.items()))
-        sorted_singles = dict(sorted(singles.items()))
+        sorted_phrases = _sort_items(phrases)
+        sorted_singles = _sort_items(singles)
 
         sorted_dict = {**sorted_phrases, **sorted_singles}
 
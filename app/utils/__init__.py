@@ -4,6 +4,7 @@ __all__ = [
     '_',
     'get_translation_dict',
     'get_stock_price',
+    'get_stock_prices',
     'xnpv',
     'xirr',
     'get_stock_price',
@@ -11,5 +12,5 @@ __all__ = [
 ]
 
 from .common import args_to_dict, _, get_translation_dict
-from .finance import get_stock_price, xnpv, xirr
-from .page_navigation import PageNavigation
+from .finance import get_stock_price, get_stock_prices, xnpv, xirr
+from .templates import PageNavigation
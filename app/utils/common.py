@@ -1,10 +1,14 @@
 # app/utils/common.py
-from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import os
-from typing import Any
-import json
+from typing import Any, Iterable
 from flask import current_app
 from datetime import date
+try:
+    from orjson import loads as _json_loads # optional, faster parsing of json arguments and dictionary files
+except ImportError:
+    from json import loads as _json_loads
 
 def args_to_dict(data: str | dict | None = None, **kwargs: Any) -> dict[str, Any]:
     """
@@ -16,10 +20,10 @@ def args_to_dict(data: str | dict | None = None, **kwargs: Any) -> dict[str, Any
     if data is None:
         data_dict = {}
     elif isinstance(data, str):
-        data_dict = json.loads(data)
+        data_dict = _json_loads(data)
     elif isinstance(data, dict):
         if kwargs and data:
-            data_dict = deepcopy(data) # avoiding modifying the original data
+            data_dict = data.copy() # avoiding modifying the original data, only top-level keys are updated
         else:
             data_dict = data
     else:
@@ -28,23 +32,57 @@ def args_to_dict(data: str | dict | None = None, **kwargs: Any) -> dict[str, Any
         data_dict.update(kwargs)
     return data_dict
 
-def get_translation_dict(lang_set: list[str], locales: list[str] = []) -> dict[str, dict[str, str]]:
+@lru_cache(maxsize=None)
+def _load_translation_file(filepath: str) -> dict[str, str]:
+    """
+    :return: the parsed dictionary file, read once per process.
+    .. attention:: the returned dict is shared, copy it before modifying.
+    """
+    return _json_loads(_read_bytes(filepath))
+
+def _read_bytes(filepath: str) -> bytes:
+    """
+    :return: the content of the file, read on a raw file descriptor without a buffered file object.
+    """
+    fd = os.open(filepath, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        # the first read takes the whole file, the following ones only confirm the end
+        chunks = [os.read(fd, os.fstat(fd).st_size + 1)]
+        while chunks[-1]:
+            chunks.append(os.read(fd, 65536))
+        return b''.join(chunks)
+    finally:
+        os.close(fd)
+
+def get_translation_dict(lang_set: Iterable[str], locales: Iterable[str] = ()) -> dict[str, dict[str, str]]:
+    """
+    :return: the merged dictionaries of `locales` by language in `lang_set`.
+    .. notes:: the result is built once per combination and shared, copy it before modifying.
+    """
+    return _build_translation_dict(tuple(lang_set), tuple(locales))
+
+@lru_cache(maxsize=None)
+def _build_translation_dict(lang_set: tuple[str, ...], locales: tuple[str, ...]) -> dict[str, dict[str, str]]:
     dir_list = [os.getcwd(), 'app', 'dbman_dict']
     base_dir = os.path.join(*dir_list)
     dbman_dict = {}
     
     if locales and lang_set:
-        try:
-            for lang in lang_set:
-                lang_dict = dict()
-                for locale in locales:
-                    filepath = os.path.join(base_dir, f'{locale}_{lang}.json')
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        jsonData = json.load(f)
-                    lang_dict.update(jsonData)
-                dbman_dict[lang] = lang_dict
-        except Exception as e:
-            raise FileNotFoundError(f"Error {e} occurred while loading dbman_dict file: {filepath}") # type: ignore
+        filepaths = {
+            (lang, locale): os.path.join(base_dir, f'{locale}_{lang}.json')
+            for lang in lang_set for locale in locales
+        }
+        # the files are read and parsed concurrently, then merged in the order of `locales`
+        with ThreadPoolExecutor(max_workers=min(8, len(filepaths))) as executor:
+            futures = {key: executor.submit(_load_translation_file, filepath) for key, filepath in filepaths.items()}
+        for lang in lang_set:
+            lang_dict = dict()
+            for locale in locales:
+                try:
+                    lang_dict.update(futures[(lang, locale)].result())
+                except Exception as e:
+                    raise FileNotFoundError(f"Error {e} occurred while loading dbman_dict file: {filepaths[(lang, locale)]}")
+            dbman_dict[lang] = lang_dict
     return dbman_dict
 
 def _(input_text:str | None, is_spec:bool = False):
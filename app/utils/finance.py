@@ -1,39 +1,88 @@
-from flask import session
-from typing import cast
+import logging
+logger = logging.getLogger(__name__)
+from time import monotonic
+from typing import Any, cast, Iterable
 from datetime import date, timedelta
-from yfinance import Ticker
+from yfinance import download
 from scipy.optimize import brentq
+import numpy as np
 import requests, xml.etree.ElementTree as ET
 
+_price_cache: dict[tuple[str, date], tuple[float, float]] = {} # (code, target_date) -> (price, fetched at)
+_price_cache_ttl = 3600.0
+_price_cache_maxsize = 4096
+
 def get_stock_price(code: str, target_date: date = date.today()) -> float | None:
     """
     Get the stock price for a given stock code.
+    Prices are cached for the whole process by code and target date for an hour.
     :param code: The stock code.
     :return: The stock price or None if not available.
     """    
-    price_dict = session.get('CACHED_STOCK_PRICE', None)
-    if price_dict and code in price_dict:
-        price_list = price_dict[code]
-        if price_list and price_list[1] == target_date and price_list[0] is not None:
-            return price_list[0]
-    ticker = Ticker(code)
-    hist = ticker.history(
-        start=target_date - timedelta(days=14),
-        end = target_date + timedelta(days=1),
-        auto_adjust=False
-    )
-    if hist.empty:
-        return None
-    closes = hist['Close'].dropna()
-    closes = closes[
-        closes.index.to_series().dt.date.le(target_date)
-    ]
-    if closes.empty:
-        return None
-    price = float(closes.iloc[-1])
-    session['CACHED_STOCK_PRICE'] = dict()
-    session['CACHED_STOCK_PRICE'][code] = [price, date.today()]
-    return price
+    return get_stock_prices((code,), target_date)[code]
+def get_stock_prices(codes: Iterable[str], target_date: date = date.today()) -> dict[str, float | None]:
+    """
+    Get the stock prices for several stock codes, fetching the uncached ones in one batched download.
+    :param codes: The stock codes.
+    :return: The stock price or None if not available, by code.
+    """
+    now = monotonic()
+    prices: dict[str, float | None] = {}
+    missing: list[str] = []
+    for code in dict.fromkeys(codes):
+        cached = _price_cache.get((code, target_date))
+        if cached is not None and now - cached[1] < _price_cache_ttl:
+            prices[code] = cached[0]
+        else:
+            missing.append(code)
+    if not missing:
+        return prices
+    try:
+        hist = download(
+            tickers=' '.join(missing),
+            start=target_date - timedelta(days=14),
+            end=target_date + timedelta(days=1),
+            group_by='ticker',
+            threads=True,
+            auto_adjust=False,
+            progress=False
+        )
+    except Exception as e: # a failed download leaves every code of the batch without price
+        logger.warning(f'Failed to download stock prices of {missing}: {e}')
+        hist = None
+    frames: dict[str, Any] = {}
+    if hist is not None and not hist.empty:
+        if hist.columns.nlevels == 1: # some yfinance versions return flat columns for a single ticker
+            if len(missing) == 1:
+                frames[missing[0]] = hist
+        else:
+            frames = {code: hist[code] for code in set(hist.columns.get_level_values(0))}
+    for code in missing:
+        price = None
+        frame = frames.get(code)
+        if frame is not None and 'Close' in frame:
+            closes = frame['Close'].dropna()
+            closes = closes[
+                closes.index.to_series().dt.date.le(target_date)
+            ]
+            if not closes.empty:
+                price = float(closes.iloc[-1])
+                _price_cache.pop((code, target_date), None)
+                if len(_price_cache) >= _price_cache_maxsize:
+                    _price_cache.pop(next(iter(_price_cache)), None) # drop the oldest entry
+                _price_cache[(code, target_date)] = (price, monotonic())
+        prices[code] = price
+    return prices
+def _flow_arrays(flows: list[tuple[date, float]]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    :return: years since the first flow and the cash flow amounts as float arrays.
+    """
+    start = flows[0][0]
+    years = np.fromiter(((dt - start).days / 365.0 for dt, _ in flows), dtype=np.float64, count=len(flows))
+    cfs = np.fromiter((cf for _, cf in flows), dtype=np.float64, count=len(flows))
+    return years, cfs
+def _xnpv(rate: float, years: np.ndarray, cfs: np.ndarray) -> float:
+    return float((cfs / (1 + rate) ** years).sum())
 def xnpv(rate: float, flows: list[tuple[date, float]]) -> float:
     """
     Calculate the net present value (NPV) of a series of cash flows.
@@ -44,21 +93,51 @@ def xnpv(rate: float, flows: list[tuple[date, float]]) -> float:
     """
     if not flows:
         return 0.0
-    return sum(cf / (1 + rate) ** ((dt - flows[0][0]).days / 365.0) for dt, cf in flows)
+    return _xnpv(rate, *_flow_arrays(flows))
+def _has_single_root(years: np.ndarray, cfs: np.ndarray) -> bool:
+    """
+    :return: True if the flows, summed per date and ordered by date, change sign exactly once.
+    By Descartes' rule of signs the NPV then has at most one root above a rate of -100%.
+    """
+    unique_years, inverse = np.unique(years, return_inverse=True)
+    amounts = np.bincount(inverse, weights=cfs, minlength=len(unique_years))
+    signs = np.sign(amounts[amounts != 0])
+    return int(np.count_nonzero(signs[1:] != signs[:-1])) == 1
 def xirr(flows: list[tuple[date, float]]) -> float:
     """
     Calculate the internal rate of return (IRR) for a series of cash flows.
+    Newton's method with the analytic derivative of the NPV is tried first when the root is unique, 
+    brentq over the full rate range is used otherwise and when Newton does not converge.
     :param flows: A list of tuples containing the date and cash flow amount.
     :return: The IRR of the cash flows.
     """
     if not flows or len(flows) < 2 or all(cf == 0 for _, cf in flows) or all(dt == flows[0][0] for dt, _ in flows):
         return 0.0
+    years, cfs = _flow_arrays(flows)
+    low, high = -0.9999+1e-6, 10000
+    rate = 0.1
+    # without a sign change over the range brentq raises, keep that behaviour.
+    # with several sign changes in the flows there may be several roots, 
+    # Newton could settle on another one than brentq, so leave it to brentq.
+    bracketed = _xnpv(low, years, cfs) * _xnpv(high, years, cfs) < 0
+    for _ in range(50 if bracketed and _has_single_root(years, cfs) else 0):
+        discounted = cfs * (1 + rate) ** -years
+        npv = float(discounted.sum())
+        d_npv = float((-years * discounted).sum()) / (1 + rate)
+        if d_npv == 0 or not np.isfinite(d_npv):
+            break
+        step = npv / d_npv
+        rate -= step
+        if not low < rate < high:
+            break
+        if abs(step) <= 1e-12 * max(1.0, abs(rate)):
+            return rate
     return cast( 
         float,
         brentq(
-            xnpv, 
-            -0.9999+1e-6, 
-            10000, 
-            args=(flows)
+            _xnpv, 
+            low, 
+            high, 
+            args=(years, cfs)
         )
     )
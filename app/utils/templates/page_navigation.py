@@ -8,12 +8,5 @@ class PageNavigation:
         self.index = index
 
     def get_nav(self, nav : dict[str, str]) -> dict[str, str]:
-        # 如果定义了本视图的基础字典，使用基础字典，否则使用默认字典
-        if self.index:
-            updated = self.index.copy()
-        else:
-            updated = {}
-        # 更新参数中的字典到视图的基础字典
-        for key in nav:
-            updated[key] = nav[key]
-        return updated
+        # 参数中的字典覆盖视图的基础字典，未定义基础字典时仅复制参数字典
+        return self.index | nav if self.index else dict(nav)
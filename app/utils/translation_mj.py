@@ -1,58 +1,90 @@
 # app/utils/translation_mj.py
 import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
 from flask import session
 
+_token_pattern = re.compile(r'\w+|\W+')
+_word_pattern = re.compile(r'\w+')
+# 词及其后紧跟下一个词的空白，下一个词仅前瞻不消耗；其余非词字符单独匹配
+_zh_token_pattern = re.compile(r'(\w+)(?:(\s+)(?=(\w+)))?|\W+')
+_empty_dict: Mapping[str, dict[str, str]] = MappingProxyType({})
+_empty_lookup: tuple[re.Pattern[str] | None, dict[str, str], frozenset[str]] = (None, {}, frozenset())
+
 class TranslationMJ:
 
     def __init__(self, 
                  lang_set:list[str],
                  lang: str,
-                 general_dict: dict[str, dict[str, str]] = {}, 
-                 spec_dict: dict[str, dict[str, str]] = {}) -> None:
+                 general_dict: Mapping[str, dict[str, str]] = _empty_dict, 
+                 spec_dict: Mapping[str, dict[str, str]] = _empty_dict) -> None:
         self.lang_set = lang_set
         self.lang = lang
         self.general_dict = general_dict
         self.spec_dict = spec_dict
+        # (lang, is_spec) -> (compiled phrase alternation or None, lowercased dict, first chars of keys)
+        # 所有语言的查找表在初始化时一次建好，翻译时只读
+        self._lookups: dict[tuple[str, bool], tuple[re.Pattern[str] | None, dict[str, str], frozenset[str]]] = {
+            (lang, is_spec): self._build_lookup(dbman_dict)
+            for is_spec, lang_dicts in ((False, general_dict), (True, spec_dict))
+            for lang, dbman_dict in lang_dicts.items()
+        }
+        # 页面上反复出现的标签只翻译一次
+        self._translate_cached = lru_cache(maxsize=8192)(self._translate)
 
-    def translate(self, input_text: str, is_spec: bool = False):
-        lang = session.get('LANG', self.lang)
-        if is_spec:
-            dbman_dict = self.spec_dict[lang]
-        else:
-            dbman_dict = self.general_dict[lang]
-
-        # 预处理：多词短语或含特殊字符短语，按长度降序
-        multi_word_keys = sorted(
-            (key for key in dbman_dict if ' ' in key or "'" in key),
-            key=lambda x: len(x),
+    @staticmethod
+    def _build_lookup(dbman_dict: dict[str, str]) -> tuple[re.Pattern[str] | None, dict[str, str], frozenset[str]]:
+        lc_dict = {key.lower(): value for key, value in dbman_dict.items()}
+        # 多词短语或含特殊字符短语，按长度降序合并为一个正则，长短语优先匹配
+        phrases = sorted(
+            (key for key in lc_dict if ' ' in key or "'" in key),
+            key=len,
             reverse=True
         )
-        for phrase in multi_word_keys:
-            pattern = re.compile(re.escape(phrase), re.IGNORECASE)
-            input_text = pattern.sub(dbman_dict[phrase], input_text)
-
-        tokens = re.split(r'(\W+)', input_text)
-        translated_tokens: list[tuple[str, bool]] = []
-        for token in tokens:
-            lower = token.lower()
-            if lower in dbman_dict:
-                translated_tokens.append((dbman_dict[lower], True))
-            else:
-                translated_tokens.append((token, False))
-
-        # 重建最终字符串
-        # 只有目标语言是中文时，才删除相邻翻译词之间的空格
-        if lang == 'zh':
-            result: list[str] = []
-            n = len(translated_tokens)
-            for i, (token, _) in enumerate(translated_tokens):
-                if token.isspace():
-                    # 如果该空格两侧均为翻译成功的词，就跳过它
-                    if i > 0 and i < n-1 and translated_tokens[i-1][1] and translated_tokens[i+1][1]:
-                        continue
-                result.append(token)
-            return ''.join(result)
-        else:
-            # 非中文目标语言，直接保留所有空格
-            return ''.join(token for token, _ in translated_tokens)
+        pattern = None
+        if phrases:
+            pattern = re.compile('|'.join(map(re.escape, phrases)), re.IGNORECASE)
+        first_chars = frozenset(key[0] for key in lc_dict if key)
+        return pattern, lc_dict, first_chars
+
+    def translate(self, input_text: str, is_spec: bool = False):
+        return self._translate_cached(input_text, session.get('LANG', self.lang), is_spec)
+
+    def _translate(self, input_text: str, lang: str, is_spec: bool) -> str:
+        # 缺少该语言的词典时视为空词典，翻译原样返回
+        pattern, lc_dict, first_chars = self._lookups.get((lang, is_spec), _empty_lookup)
+        # 词典为空，或没有任何字符能作为词条的首字符时，无需翻译
+        if not lc_dict or first_chars.isdisjoint(input_text.lower()):
+            return input_text
+        # 单个词（最常见的标签）直接查表
+        if _word_pattern.fullmatch(input_text):
+            return lc_dict.get(input_text.lower(), input_text)
+
+        def replace(m: re.Match[str]) -> str:
+            token = m.group(0)
+            return lc_dict.get(token.lower(), token)
+
+        # 预处理：多词短语一次性替换，短语均含空格或撇号，文本不含两者时跳过
+        if pattern is not None and (' ' in input_text or "'" in input_text):
+            input_text = pattern.sub(replace, input_text)
+
+        if lang != 'zh':
+            # 非中文目标语言，逐词替换并直接保留所有空格
+            return _token_pattern.sub(replace, input_text)
+
+        # 目标语言是中文时，删除两侧均为翻译成功的词之间的空格
+        def replace_zh(m: re.Match[str]) -> str:
+            word, space, next_word = m.groups()
+            if word is None:
+                return replace(m)
+            value = lc_dict.get(word.lower())
+            if value is None:
+                value = word
+            elif space is not None and lc_dict.get(space) is None and lc_dict.get(next_word.lower()) is not None:
+                return value
+            if space is None:
+                return value
+            return value + lc_dict.get(space, space)
 
+        return _zh_token_pattern.sub(replace_zh, input_text)
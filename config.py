@@ -7,15 +7,16 @@ class Config:
     _host_env = os.getenv('HOST')
     _locales_env = os.getenv('LOCALES')
     _langset_env = os.getenv('LANGSET')
-    DEBUG = os.getenv('DEBUG', 'False')
+    DEBUG = os.getenv('DEBUG', 'False').lower() in ('1', 'true', 'yes')
     SECRET_KEY = os.getenv('SECRET_KEY')
     DATABASE_NAMES = os.getenv('DATABASE_NAMES')
     SQLALCHEMY_DATABASE_URI = os.getenv('SQLALCHEMY_DATABASE_URI')
     SQLALCHEMY_TRACK_MODIFICATION = os.getenv('SQLALCHEMY_TRACK_MODIFICATION')
-    HOST = _host_env if _host_env else '0.0.0.0' if DEBUG == 'False' else 'localhost'
+    HOST = _host_env if _host_env else 'localhost' if DEBUG else '0.0.0.0'
     SDICT_LIST = DATABASE_NAMES.split(',') if DATABASE_NAMES else []
     GDICT_LIST = _locales_env.split(',') if _locales_env else ['locale']
     LANGSET = _langset_env.split(',') if _langset_env else ['en', 'zh']
+    # built once at import, a server preloading the app (e.g. `gunicorn --preload`) shares it with its workers
     TRANSLATOR = TranslationMJ(
         LANGSET,
         'en',
@@ -15,7 +15,7 @@ load_dotenv(os.path.join(os.getcwd(), env_file))
 
 from app import create_app
 app = create_app()
-app.debug = (app.config.get('DEBUG') == 'True')
+app.debug = app.config.get('DEBUG', False)
 
 if __name__ == "__main__":
     app.run(host=app.config.get('HOST'))
\ No newline at end of file